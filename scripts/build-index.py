@@ -26,33 +26,75 @@ Output structure:
                     metadata.json           # Version-specific metadata
 
 Usage:
-    python build-index.py
+    python build-index.py                   # Build dist/
+    python build-index.py snapshot          # Cache parsed YAML in .index-snapshot.json
+
+The snapshot is a local cache (git-ignored, e.g. refreshed from a pre-commit
+hook). The build only trusts entries whose file size and mtime still match,
+and parses every other file from YAML as usual.
 """
 
 import json
+import os
 import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # YAML size and complexity limits to help mitigate resource exhaustion attacks
 MAX_YAML_SIZE = 100 * 1024  # 100 KB per file
 MAX_YAML_COMPLEXITY = 1000  # Max nodes in YAML tree
 
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Fields copied from agent.yaml into the agent metadata
+IDENTITY_FIELDS = (
+    'description',
+    'container_image',
+    'source_repository_url',
+    'primary_function',
+    'tags',
+    'capabilities',
+)
+
+# Parsed-YAML cache written by the `snapshot` command; kept at the repository
+# root next to dist/, outside the developer-owned developers/ tree
+SNAPSHOT_FILE = ".index-snapshot.json"
+
 
 class IndexBuilder:
     """Builds the agent index from YAML source files."""
 
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, snapshot: Optional[Dict[str, Any]] = None):
         self.base_path = base_path
         self.developers_path = base_path / "developers"
         self.dist_path = base_path / "dist"
         self.developers: Dict[str, Any] = {}
         self.agents: List[Dict[str, Any]] = []
+        # Agents with listed_versions, i.e. the ones published in index.json
+        self.listed_agents: List[Dict[str, Any]] = []
         self.failed_developers: int = 0
         self.failed_agents: int = 0
+        self._yaml_cache: Dict[Path, Any] = {}
+        # Output directories known to exist, so each is created only once
+        self._created_dirs: set = {str(self.dist_path)}
+        # Serialized output collected by save_json/link_json until write_outputs()
+        self._pending_files: Dict[str, bytes] = {}
+        self._pending_links: List[Tuple[str, str]] = []
+        # Single background reader used while a developer tree is being built
+        self._prefetcher: Optional[ThreadPoolExecutor] = None
+        # Snapshot entries keyed by path relative to developers/
+        self.snapshot: Dict[str, Any] = snapshot or {}
 
     def clean_dist(self):
         """Remove and recreate the dist directory."""
@@ -60,61 +102,254 @@ class IndexBuilder:
             shutil.rmtree(self.dist_path)
         self.dist_path.mkdir(parents=True)
 
-    def count_nodes(self, obj) -> int:
+    def makedirs(self, path: str):
+        """Create an output directory (and its parents) unless it was already created."""
+        if path in self._created_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        # Parents were created too; remember them so later calls are set lookups
+        while path not in self._created_dirs:
+            self._created_dirs.add(path)
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+
+    def count_nodes(self, buf: bytes) -> int:
         """
-        Recursively count nodes in a data structure.
+        Count nodes in a YAML document from its parser events, without building it.
+
+        Matches counting the loaded data structure (dict keys, list items,
+        scalars). Aliases count as the full size of the node they refer to,
+        so exponential expansion is caught without expanding anything.
+        Self-referencing aliases are rejected outright.
+
+        Raises:
+            ValueError: As soon as the count exceeds MAX_YAML_COMPLEXITY
 
         Returns:
-            Total number of nodes (dict keys, list items, scalars)
+            Total number of nodes
         """
-        if isinstance(obj, dict):
-            return sum(self.count_nodes(v) for v in obj.values()) + len(obj)
-        elif isinstance(obj, list):
-            return sum(self.count_nodes(item) for item in obj) + len(obj)
-        else:
-            return 1
+        count = 0
+        anchor_counts: Dict[str, int] = {}
+        # One [node count, anchor, expecting_key] entry per open collection;
+        # expecting_key is None for sequences
+        stack: List[List[Any]] = []
+
+        for event in yaml.parse(buf, Loader=YAML_LOADER):
+            if isinstance(event, yaml.MappingStartEvent):
+                stack.append([0, event.anchor, True])
+                continue
+            if isinstance(event, yaml.SequenceStartEvent):
+                stack.append([0, event.anchor, None])
+                continue
+
+            if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                nodes, anchor, _ = stack.pop()
+            elif isinstance(event, yaml.ScalarEvent):
+                nodes, anchor = 1, event.anchor
+            elif isinstance(event, yaml.AliasEvent):
+                # An alias to a collection that is still open would load as a cycle
+                if any(entry[1] == event.anchor for entry in stack):
+                    raise ValueError(
+                        f"YAML too complex: alias *{event.anchor} refers to a node that contains it"
+                    )
+                nodes, anchor = anchor_counts.get(event.anchor, 1), None
+            else:
+                continue
+
+            if anchor is not None:
+                anchor_counts[anchor] = nodes
+
+            if not stack:
+                count = nodes
+            else:
+                parent = stack[-1]
+                if parent[2] is True:
+                    # Mapping keys are not counted, only their values
+                    parent[2] = False
+                    continue
+                if parent[2] is False:
+                    parent[2] = True
+                parent[0] += 1 + nodes
+                count = parent[0]
 
-    def load_yaml(self, yaml_path: Path) -> Dict[str, Any]:
+            if count > MAX_YAML_COMPLEXITY:
+                raise ValueError(
+                    f"YAML too complex: more than {MAX_YAML_COMPLEXITY} nodes "
+                    f"(max {MAX_YAML_COMPLEXITY})"
+                )
+
+        return count
+
+    def load_yaml(
+        self,
+        yaml_path: Path,
+        file_stat: Optional[os.stat_result] = None,
+        buf: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """
         Load a YAML file with size and complexity validation.
 
+        Parsed results are cached per path, so loading the same file again
+        (e.g. the latest version file) is a dict lookup. Pass file_stat when
+        the caller already has it (e.g. from DirEntry.stat()) to skip the stat,
+        and buf when the file's bytes were already read (see iter_file_bytes).
+
         Raises:
+            FileNotFoundError: If the file does not exist
             ValueError: If file exceeds size or complexity limits
         """
+        if yaml_path in self._yaml_cache:
+            return self._yaml_cache[yaml_path]
+
         # Check file size before loading
-        file_size = yaml_path.stat().st_size
+        if file_stat is None:
+            file_stat = yaml_path.stat()
+        file_size = file_stat.st_size
+
+        # Reuse the snapshot entry if the file is unchanged since it was taken
+        if self.snapshot:
+            entry = self.snapshot.get(yaml_path.relative_to(self.developers_path).as_posix())
+            if (entry is not None and entry['size'] == file_size
+                    and entry['mtime_ns'] == file_stat.st_mtime_ns):
+                self._yaml_cache[yaml_path] = entry['data']
+                return entry['data']
+
         if file_size > MAX_YAML_SIZE:
             raise ValueError(
                 f"YAML file too large: {file_size} bytes (max {MAX_YAML_SIZE})"
             )
 
-        with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+        if buf is None:
+            with open(yaml_path, 'rb') as f:
+                buf = f.read()
 
-        # Check complexity after parsing to detect exponential expansion
-        node_count = self.count_nodes(data)
-        if node_count > MAX_YAML_COMPLEXITY:
-            raise ValueError(
-                f"YAML too complex: {node_count} nodes (max {MAX_YAML_COMPLEXITY})"
-            )
+        # Check complexity before constructing anything to detect exponential expansion
+        self.count_nodes(buf)
+        data = yaml.load(buf, Loader=YAML_LOADER)
 
+        self._yaml_cache[yaml_path] = data
         return data
 
-    def save_json(self, data: Any, output_path: Path):
-        """Save data as formatted JSON."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def load_snapshot(self) -> Dict[str, Any]:
+        """Load the YAML snapshot, or return an empty one if missing or unreadable."""
+        snapshot_path = self.base_path / SNAPSHOT_FILE
+        try:
+            with open(snapshot_path, 'r') as f:
+                return json.load(f)['files']
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def write_snapshot(self) -> int:
+        """
+        Parse every YAML file under developers/ and cache the results.
+
+        Files that fail to load or hold non-JSON values are left out, so the
+        build parses (and reports) them as usual.
+
+        Returns:
+            Number of files written to the snapshot
+        """
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(self.developers_path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.endswith('.yaml') or filename.startswith('.'):
+                    continue
+                yaml_path = Path(dirpath, filename)
+                try:
+                    file_stat = yaml_path.stat()
+                    data = self.load_yaml(yaml_path)
+                    json.dumps(data)
+                except Exception:
+                    continue
+                files[yaml_path.relative_to(self.developers_path).as_posix()] = {
+                    'size': file_stat.st_size,
+                    'mtime_ns': file_stat.st_mtime_ns,
+                    'data': data,
+                }
+
+        self.save_json({'files': files}, self.base_path / SNAPSHOT_FILE)
+        self.write_outputs()
+        return len(files)
+
+    def iter_file_bytes(self, paths: List[Path]) -> Iterator[Optional[bytes]]:
+        """
+        Yield the bytes of each file in order, reading one file ahead.
+
+        While the caller parses a file, the prefetch thread reads the next
+        one. Yields None (the caller reads the file itself) when there is no
+        prefetcher, nothing to overlap, or the snapshot makes reads unneeded.
+        """
+        if self._prefetcher is None or len(paths) < 2 or self.snapshot:
+            for _ in paths:
+                yield None
+            return
+
+        submit = self._prefetcher.submit
+        future = submit(read_file_head, paths[0], MAX_YAML_SIZE + 1)
+        for next_path in paths[1:]:
+            buf = future.result()
+            future = submit(read_file_head, next_path, MAX_YAML_SIZE + 1)
+            yield buf
+        yield future.result()
+
+    def save_json(self, data: Any, output_path: Union[str, Path]):
+        """
+        Serialize data as formatted JSON, to be written by write_outputs().
+
+        Saving the same path again replaces the pending content.
+        """
+        if orjson is not None:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            buf = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        self._pending_files[str(output_path)] = buf
+
+    def link_json(self, source_path: Union[str, Path], output_path: Union[str, Path]):
+        """Publish a saved JSON file at a second path (hardlinked by write_outputs())."""
+        self._pending_links.append((str(source_path), str(output_path)))
+
+    def write_outputs(self):
+        """
+        Write all pending JSON files in one pass, creating directories as needed.
+
+        Raw fd writes skip the buffered/text I/O layers for these small
+        files; linked copies are hardlinks where the filesystem allows.
+        Pending outputs are taken up front, so a write that fails leaves
+        nothing behind for the next call.
+        """
+        pending_files, self._pending_files = self._pending_files, {}
+        pending_links, self._pending_links = self._pending_links, []
+
+        makedirs = self.makedirs
+        for output_path, buf in pending_files.items():
+            makedirs(os.path.dirname(output_path))
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(buf)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+        for source_path, output_path in pending_links:
+            makedirs(os.path.dirname(output_path))
+            try:
+                os.link(source_path, output_path)
+            except OSError:
+                shutil.copyfile(source_path, output_path)
 
     def process_developer(self, developer_dir: Path) -> Dict[str, Any]:
         """Process a single developer directory."""
         developer_name = developer_dir.name
         profile_path = developer_dir / "profile.yaml"
 
-        if not profile_path.exists():
-            raise FileNotFoundError(f"Missing profile.yaml for {developer_name}")
-
-        profile_data = self.load_yaml(profile_path)
+        try:
+            profile_data = self.load_yaml(profile_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Missing profile.yaml for {developer_name}") from None
 
         # Validate developer field matches folder name
         if profile_data.get('developer') != developer_name:
@@ -139,10 +374,12 @@ class IndexBuilder:
 
         # Read agent identity
         agent_yaml_path = agent_dir / "agent.yaml"
-        if not agent_yaml_path.exists():
-            raise FileNotFoundError(f"Missing agent.yaml in {developer_name}/agents/{agent_name}")
-
-        identity_data = self.load_yaml(agent_yaml_path)
+        try:
+            identity_data = self.load_yaml(agent_yaml_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Missing agent.yaml in {developer_name}/agents/{agent_name}"
+            ) from None
 
         # Validate developer field matches folder name
         if identity_data.get('developer') != developer_name:
@@ -158,79 +395,83 @@ class IndexBuilder:
                 f"does not match directory name '{agent_name}'"
             )
 
+        # Identity fields, built once and shared by any version merged below
+        identity_fragment = {
+            'name': agent_name,
+            'developer': developer_name,
+            **{key: identity_data.get(key) for key in IDENTITY_FIELDS},
+        }
+
         # Read version management
         versions_yaml_path = agent_dir / "versions.yaml"
-        if not versions_yaml_path.exists():
-            raise FileNotFoundError(f"Missing versions.yaml in {developer_name}/agents/{agent_name}")
-
-        versions_data = self.load_yaml(versions_yaml_path)
+        try:
+            versions_data = self.load_yaml(versions_yaml_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Missing versions.yaml in {developer_name}/agents/{agent_name}"
+            ) from None
         latest_version_string = versions_data.get('latest_version')
         listed_versions = versions_data.get('listed_versions', [])
 
         if not latest_version_string:
             raise ValueError(f"Agent {developer_name}/{agent_name} missing 'latest_version' field in versions.yaml")
 
-        # Read the latest version file
+        # Read all version files for available versions list
+        # Pattern matches files like 0.1.0.yaml, 1.0.0-beta.1.yaml
+        with os.scandir(agent_dir) as it:
+            # Same selection as glob("*.yaml"): hidden names and non-files included
+            version_entries = {
+                e.name: e for e in it
+                if e.name.endswith('.yaml')
+                and e.name not in {'agent.yaml', 'versions.yaml'}
+            }
+
+        # Check the latest version file exists (it is loaded with the others below)
         latest_version_file = agent_dir / f"{latest_version_string}.yaml"
-        if not latest_version_file.exists():
+        if latest_version_file.name not in version_entries and not latest_version_file.exists():
             raise ValueError(
                 f"Agent {developer_name}/{agent_name} specifies latest: '{latest_version_string}' "
                 f"but {latest_version_string}.yaml does not exist"
             )
 
-        latest_version = self.load_yaml(latest_version_file)
-
-        # Validate version in file matches filename
-        file_version = latest_version_file.stem
-        data_version = latest_version.get('version', '')
-        if data_version != file_version:
-            raise ValueError(
-                f"Version in {latest_version_file.name} ('{data_version}') "
-                f"does not match filename (expected '{file_version}')"
-            )
-
-        # Read all version files for available versions list
-        # Pattern matches files like 0.1.0.yaml, 1.0.0-beta.1.yaml
-        version_files = sorted([f for f in agent_dir.glob("*.yaml")
-                               if f.name not in ['agent.yaml', 'versions.yaml']])
-        if not version_files:
+        if not version_entries:
             raise ValueError(f"Agent {developer_name}/{agent_name} has no version files")
 
-        versions = []
-        for version_file in version_files:
-            version_data = self.load_yaml(version_file)
+        # Version data keyed by version string (validated to match the filename)
+        versions_by_str: Dict[str, Dict[str, Any]] = {}
+        load_yaml = self.load_yaml
+        version_items = sorted(version_entries.items())
+        version_bytes = self.iter_file_bytes([agent_dir / name for name, _ in version_items])
+        for (name, entry), buf in zip(version_items, version_bytes):
+            version_data = load_yaml(agent_dir / name, entry.stat(), buf)
 
-            # Validate version in file matches filename
-            file_version = version_file.stem
+            # Validate version in file matches filename (name ends in '.yaml')
+            file_version = name[:-5]
             data_version = version_data.get('version', '')
             if data_version != file_version:
                 raise ValueError(
-                    f"Version in {version_file.name} ('{data_version}') "
+                    f"Version in {name} ('{data_version}') "
                     f"does not match filename (expected '{file_version}')"
                 )
 
-            versions.append(version_data)
+            versions_by_str[file_version] = version_data
+
+        latest_version = versions_by_str.get(latest_version_file.stem)
+        if latest_version is None:
+            raise ValueError(
+                f"Agent {developer_name}/{agent_name} specifies latest: '{latest_version_string}' "
+                f"but {latest_version_string}.yaml is not a version file"
+            )
 
         # Build merged data: identity + latest version
-        merged_data = {}
-
-        # Copy all version-specific data from latest version
-        for key, value in latest_version.items():
-            if value is not None:
-                merged_data[key] = value
-
-        # Add identity fields
-        merged_data['name'] = agent_name
-        merged_data['developer'] = developer_name
-        merged_data['description'] = identity_data.get('description')
-        merged_data['container_image'] = identity_data.get('container_image')
-        merged_data['source_repository_url'] = identity_data.get('source_repository_url')
-        merged_data['primary_function'] = identity_data.get('primary_function')
-        merged_data['tags'] = identity_data.get('tags')
-        merged_data['capabilities'] = identity_data.get('capabilities')
+        merged_data = {
+            # All version-specific data from latest version
+            **{key: value for key, value in latest_version.items() if value is not None},
+            **identity_fragment,
+        }
 
         # Auto-derive container tag from version
-        container_base = identity_data.get('container_image', '')
+        container_base = identity_fragment['container_image']
         version_tag = latest_version.get('version', '')
         if container_base and version_tag:
             merged_data['container_image_full'] = f"{container_base}:{version_tag}"
@@ -243,8 +484,7 @@ class IndexBuilder:
         # Include version-specific requirements so UI can display requirements per version
         available_versions = []
         for version_string in listed_versions:
-            # Find the version data
-            version_data = next((v for v in versions if v.get('version') == version_string), None)
+            version_data = versions_by_str.get(version_string)
             if version_data:
                 available_versions.append({
                     'version': version_string,
@@ -264,64 +504,54 @@ class IndexBuilder:
 
         return merged_data
 
-    def build_developers(self):
-        """Process all developer profiles."""
-        print("\n" + "="*70)
-        print("PROCESSING DEVELOPERS")
-        print("="*70)
-
-        for developer_dir in sorted(self.developers_path.iterdir()):
-            if not developer_dir.is_dir():
-                continue
-
-            try:
-                developer_data = self.process_developer(developer_dir)
-                developer_name = developer_data['developer']
-
-                self.developers[developer_name] = developer_data
-
-                # Save individual developer profile
-                output_path = self.dist_path / f"@{developer_name}" / "profile.json"
-                self.save_json(developer_data, output_path)
-
-                print(f"✅ {developer_name}")
-
-            except Exception as e:
-                print(f"❌ {developer_dir.name}: {e}")
-                self.failed_developers += 1
-                # Continue processing other developers instead of failing entire build
-                continue
-
-    def build_agents(self):
-        """Process all agent definitions."""
-        print("\n" + "="*70)
-        print("PROCESSING AGENTS")
-        print("="*70)
-
-        for developer_dir in sorted(self.developers_path.iterdir()):
-            if not developer_dir.is_dir():
-                continue
-
-            developer_name = developer_dir.name
-            agents_dir = developer_dir / "agents"
-
-            if not agents_dir.exists():
-                continue
-
-            developer_agents = []
+    def build_developer_tree(
+        self,
+        developer_dir: Path
+    ) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], List[str], List[str], int]:
+        """
+        Process one developer's profile and agents, writing their JSON files.
 
-            # Iterate through agent directories
-            for agent_dir in sorted(agents_dir.iterdir()):
-                if not agent_dir.is_dir():
-                    continue
+        Returns:
+            Tuple of (profile_data or None if the profile failed, agents,
+            developer log lines, agent log lines, failed agent count)
+        """
+        developer_name = developer_dir.name
+        developer_log = []
+        agent_log = []
+        agents = []
+        failed_agents = 0
+
+        try:
+            profile_data = self.process_developer(developer_dir)
+            developer_log.append(f"✅ {developer_name}")
+
+        except Exception as e:
+            developer_log.append(f"❌ {developer_name}: {e}")
+            profile_data = None
+
+        agents_dir = developer_dir / "agents"
+        has_agents_dir = agents_dir.exists()
+        agent_names = []
+        if has_agents_dir:
+            with os.scandir(agents_dir) as it:
+                agent_names = [e.name for e in it if e.is_dir()]
+            agent_names.sort()
+
+        developer_agents = []
+        dev_dir_str = f"{self.dist_path}/@{developer_name}"
+
+        # Iterate through agent directories; version files are read one ahead
+        self._prefetcher = ThreadPoolExecutor(max_workers=1)
+        try:
+            for name in agent_names:
+                agent_dir = agents_dir / name
 
                 try:
                     agent_data = self.process_agent(agent_dir, developer_name)
                     agent_name = agent_data['name']
                     version = agent_data['version']
 
-                    # Add to global agents list
-                    self.agents.append(agent_data)
+                    agents.append(agent_data)
 
                     # Add to developer's agents list
                     developer_agents.append({
@@ -333,36 +563,89 @@ class IndexBuilder:
                     })
 
                     # Save version-specific metadata
-                    version_path = (
-                        self.dist_path / f"@{developer_name}" / agent_name / version / "metadata.json"
-                    )
+                    agent_dir_str = f"{dev_dir_str}/{agent_name}"
+                    version_path = f"{agent_dir_str}/{version}/metadata.json"
                     self.save_json(agent_data, version_path)
 
-                    # Save latest metadata (without version in path)
-                    latest_path = (
-                        self.dist_path / f"@{developer_name}" / agent_name / "metadata.json"
-                    )
-                    self.save_json(agent_data, latest_path)
+                    # Save latest metadata (without version in path); same bytes as above
+                    self.link_json(version_path, f"{agent_dir_str}/metadata.json")
 
-                    print(f"✅ @{developer_name}/{agent_name}@{version}")
+                    # Write inside the per-agent error handling so one agent that
+                    # can't be written doesn't abort the whole build
+                    self.write_outputs()
+
+                    agent_log.append(f"✅ @{developer_name}/{agent_name}@{version}")
 
                 except Exception as e:
-                    print(f"❌ {agent_dir.name}: {e}")
-                    self.failed_agents += 1
+                    agent_log.append(f"❌ {agent_dir.name}: {e}")
+                    failed_agents += 1
                     # Continue processing other agents instead of failing entire build
                     continue
+        finally:
+            self._prefetcher.shutdown()
+            self._prefetcher = None
 
-            # Update developer agent count
-            if developer_name in self.developers:
-                self.developers[developer_name]['_agent_count'] = len(developer_agents)
+        if profile_data is not None:
+            if has_agents_dir:
+                profile_data['_agent_count'] = len(developer_agents)
 
                 # Save developer's agents list
-                agents_list_path = self.dist_path / f"@{developer_name}" / "agents.json"
-                self.save_json(developer_agents, agents_list_path)
+                self.save_json(developer_agents, f"{dev_dir_str}/agents.json")
+
+            # Save developer profile once its agent count is known
+            self.save_json(profile_data, f"{dev_dir_str}/profile.json")
 
-                # Update developer profile with agent count
-                profile_path = self.dist_path / f"@{developer_name}" / "profile.json"
-                self.save_json(self.developers[developer_name], profile_path)
+        self.write_outputs()
+
+        return profile_data, agents, developer_log, agent_log, failed_agents
+
+    def build_developers(self):
+        """Process all developer profiles and their agents, one process per developer."""
+        with os.scandir(self.developers_path) as it:
+            developer_names = [e.name for e in it if e.is_dir()]
+        developer_names.sort()
+        developer_dirs = [self.developers_path / name for name in developer_names]
+
+        # Developers write disjoint dist/@{developer} subtrees, so they can be
+        # processed independently; results are merged here in sorted order
+        workers = min(len(developer_dirs), os.cpu_count() or 1)
+        if workers > 1:
+            # Hand each worker only its own slice of the snapshot, grouping
+            # keys by their first path segment (the developer) in one pass
+            slices = {name: {} for name in developer_names}
+            for key, entry in self.snapshot.items():
+                developer_slice = slices.get(key.split('/', 1)[0])
+                if developer_slice is not None:
+                    developer_slice[key] = entry
+            snapshots = [slices[name] for name in developer_names]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(process_developer_tree, developer_dirs, snapshots))
+        else:
+            results = [self.build_developer_tree(d) for d in developer_dirs]
+
+        print("\n" + "="*70)
+        print("PROCESSING DEVELOPERS")
+        print("="*70)
+
+        for profile_data, _, developer_log, _, _ in results:
+            for line in developer_log:
+                print(line)
+            if profile_data is None:
+                self.failed_developers += 1
+                # Continue processing other developers instead of failing entire build
+                continue
+            self.developers[profile_data['developer']] = profile_data
+
+        print("\n" + "="*70)
+        print("PROCESSING AGENTS")
+        print("="*70)
+
+        for _, agents, _, agent_log, failed_agents in results:
+            for line in agent_log:
+                print(line)
+            self.agents.extend(agents)
+            self.listed_agents.extend(agent for agent in agents if agent['_is_listed'])
+            self.failed_agents += failed_agents
 
     def build_indexes(self):
         """Build top-level index files."""
@@ -370,6 +653,9 @@ class IndexBuilder:
         print("BUILDING INDEXES")
         print("="*70)
 
+        # Single build timestamp shared by every entry
+        now_iso = datetime.now(UTC).isoformat().replace('+00:00', 'Z')
+
         # Build developers index
         developers_list = [
             {
@@ -388,23 +674,21 @@ class IndexBuilder:
         developers_index = {
             'developers': developers_list,
             'count': len(developers_list),
-            'last_updated': datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
+            'last_updated': now_iso,
         }
 
         self.save_json(developers_index, self.dist_path / "developers.json")
         print(f"✅ developers.json ({len(developers_list)} developers)")
 
-        # Build agents index
-        agents_list = []
-        for agent in self.agents:
-            # Only include agents that have listed_versions
-            if not agent.get('_is_listed', False):
-                continue
-
+        # Build agents index (only agents that have listed_versions)
+        listed = self.listed_agents
+        developers_map = self.developers
+        agents_list: List[Any] = [None] * len(listed)
+        for i, agent in enumerate(listed):
             developer_name = agent['developer']
-            developer_data = self.developers.get(developer_name, {})
+            developer_data = developers_map.get(developer_name, {})
 
-            agents_list.append({
+            agents_list[i] = {
                 # Core fields
                 'developer': developer_name,
                 'name': agent['name'],
@@ -430,7 +714,7 @@ class IndexBuilder:
                 'required_egress': agent.get('required_egress'),
 
                 # Timestamp
-                'created_at': agent.get('created_at', datetime.now(UTC).isoformat().replace('+00:00', 'Z')),
+                'created_at': agent.get('created_at', now_iso),
 
                 # IDs
                 '_id': agent['_id'],
@@ -438,15 +722,16 @@ class IndexBuilder:
 
                 # Version info
                 '_available_versions': agent.get('_available_versions', []),
-            })
+            }
 
         agents_index = {
             'agents': agents_list,
             'count': len(agents_list),
-            'last_updated': datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
+            'last_updated': now_iso,
         }
 
         self.save_json(agents_index, self.dist_path / "index.json")
+        self.write_outputs()
         print(f"✅ index.json ({len(agents_list)} published agents)")
 
     def build(self):
@@ -454,8 +739,8 @@ class IndexBuilder:
         print("\n🚀 Starting agent-index build process...\n")
 
         self.clean_dist()
+        self.snapshot = self.load_snapshot()
         self.build_developers()
-        self.build_agents()
         self.build_indexes()
 
         print("\n" + "="*70)
@@ -472,11 +757,28 @@ class IndexBuilder:
             print("🎉 Build completed successfully!\n")
 
 
+def read_file_head(path: Path, limit: int) -> bytes:
+    """Read at most limit bytes of a file (used from the prefetch thread)."""
+    with open(path, 'rb') as f:
+        return f.read(limit)
+
+
+def process_developer_tree(developer_dir: Path, snapshot: Optional[Dict[str, Any]] = None):
+    """Build one developer tree in a worker process (see IndexBuilder.build_developer_tree)."""
+    builder = IndexBuilder(developer_dir.parent.parent, snapshot)
+    return builder.build_developer_tree(developer_dir)
+
+
 def main():
     """Main build entry point."""
     base_path = Path(__file__).parent.parent
     builder = IndexBuilder(base_path)
 
+    if len(sys.argv) > 1 and sys.argv[1] == "snapshot":
+        count = builder.write_snapshot()
+        print(f"✅ {SNAPSHOT_FILE} ({count} files)")
+        return
+
     try:
         builder.build()
     except Exception as e:
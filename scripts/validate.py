@@ -30,164 +30,600 @@ Usage:
     python validate.py developers/username     # Validate specific developer folder
 """
 
+import functools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
 from jsonschema import Draft7Validator, ValidationError
 
-# GitHub username validation (alphanumeric with hyphens)
-VALID_DEVELOPER_NAME = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$')
+# Optional code-generating validator; jsonschema still reports the detailed errors
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# GitHub username validation (alphanumeric with hyphens); use with fullmatch()
+VALID_DEVELOPER_NAME = re.compile(r'[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?', re.ASCII)
+
+# Version file names, e.g. 0.1.0.yaml or 1.0.0-beta.1.yaml (same version rule as the schemas)
+VERSION_FILE_NAME = re.compile(r'[0-9]+\.[0-9]+\.[0-9]+(-[a-z0-9.]+)?\.yaml', re.ASCII)
 
 # YAML size and complexity limits
 MAX_YAML_SIZE = 100 * 1024  # 100 KB per file
 MAX_YAML_COMPLEXITY = 1000  # Max nodes in YAML tree
 
+# Without aliases a document holds at most two counted nodes per byte (a lone "-"
+# is a one-byte list holding a null), so smaller alias-free files can't exceed
+# MAX_YAML_COMPLEXITY and skip the count
+MAX_UNCOUNTED_YAML_SIZE = MAX_YAML_COMPLEXITY // 2
+
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # File type restrictions
 ALLOWED_FILE_EXTENSIONS = {'.yaml'}
 
 # File size limits
 MAX_DEVELOPER_FOLDER_SIZE = 10 * 1024 * 1024  # 10 MB total per developer
 
+# Concurrent reads used to overlap disk latency when loading an agent's files
+BULK_READ_WORKERS = 8
+
+# fastjsonschema functions compiled on first use, keyed by id(Draft7Validator);
+# None marks a schema that fastjsonschema couldn't compile
+FAST_VALIDATORS: Dict[int, Optional[Callable[[Any], Any]]] = {}
+
+# Schema files under schema/, keyed by the name validators are passed around as
+SCHEMA_FILES = {
+    'developer': "developer.schema.json",
+    'agent_identity': "agent-identity.schema.json",
+    'versions': "versions.schema.json",
+    'agent_version': "agent-version.schema.json",
+}
+
+
+def read_file_bytes(path: Union[str, Path], limit: Optional[int] = None) -> bytes:
+    """
+    Read a file's raw bytes with os.open/os.read, skipping the buffered file object.
+
+    Args:
+        path: File to read
+        limit: Stop after this many bytes (None reads to EOF)
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        chunk_size = os.fstat(fd).st_size + 1
+        remaining = limit
+        chunks = []
+        # os.read may return short, so keep going until EOF or the limit
+        while remaining is None or remaining > 0:
+            chunk = os.read(fd, chunk_size if remaining is None else remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def read_yaml_bytes(path: str) -> Optional[bytes]:
+    """Read a YAML file up to just past MAX_YAML_SIZE, or None if it can't be read."""
+    try:
+        return read_file_bytes(path, MAX_YAML_SIZE + 1)
+    except OSError:
+        return None  # load_yaml reads it again and reports the error
+
+
+@functools.lru_cache(maxsize=None)
+def get_read_pool() -> ThreadPoolExecutor:
+    """Return this process's shared reader thread pool, created on first use."""
+    return ThreadPoolExecutor(max_workers=BULK_READ_WORKERS)
+
+
+def bulk_read(paths: List[str]) -> Dict[str, bytes]:
+    """
+    Read many small files concurrently so their open/read latencies overlap.
+
+    Files that could not be read are left out; callers fall back to reading
+    them directly, which surfaces the error.
+
+    Returns:
+        Dict mapping path to file contents (capped just past MAX_YAML_SIZE)
+    """
+    if len(paths) <= 1:
+        return {}
+    contents = zip(paths, get_read_pool().map(read_yaml_bytes, paths))
+    return {path: buf for path, buf in contents if buf is not None}
+
 
 def load_schema(schema_path: Path) -> dict:
-    """Load a JSON schema file."""
-    with open(schema_path, 'r') as f:
-        return json.load(f)
+    """Load a JSON schema file (parsed with orjson when it is installed)."""
+    raw = read_file_bytes(schema_path)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@functools.lru_cache(maxsize=None)
+def _validator_for(schema_id: str, schema_text: str) -> Draft7Validator:
+    """
+    Check and compile a schema once per distinct schema document.
+
+    Keyed on the schema's $id (or its path when it has none) plus its
+    canonical JSON text, so the same schema reached through different
+    paths shares one validator and its warm reference-resolution caches.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    schema = json.loads(schema_text)
+    Draft7Validator.check_schema(schema)
+    validator = Draft7Validator(schema)
+    # Validate a dummy object once so lazily built internals (format checker,
+    # reference resolver) are ready before the first real file
+    next(validator.iter_errors({}), None)
+    return validator
+
+
+def get_fast_validator(validator: Draft7Validator) -> Optional[Callable[[Any], Any]]:
+    """
+    Return a fastjsonschema function for the validator's schema, compiling it on first use.
+
+    The generated function only checks the happy path (it raises on the first
+    problem). Returns None when fastjsonschema is unavailable or can't compile
+    the schema, leaving everything to jsonschema.
+    """
+    if fastjsonschema is None:
+        return None
+
+    key = id(validator)
+    if key not in FAST_VALIDATORS:
+        try:
+            FAST_VALIDATORS[key] = fastjsonschema.compile(validator.schema, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            FAST_VALIDATORS[key] = None
+    return FAST_VALIDATORS[key]
+
+
+@functools.lru_cache(maxsize=None)
+def get_validator(schema_path: str) -> Draft7Validator:
+    """
+    Load a JSON schema file once per process and return its compiled validator.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    schema = load_schema(Path(schema_path))
+    schema_id = schema.get('$id') or schema_path
+    return _validator_for(schema_id, json.dumps(schema, sort_keys=True))
+
+
+class SchemaRegistry:
+    """
+    Schema validators by SCHEMA_FILES name, each compiled on first use.
 
+    Only the schema paths are stored, so a registry pickles cheaply into
+    pool workers, which then compile what they need once per process.
+    """
+
+    def __init__(self, base_path: Path):
+        schema_dir = base_path / "schema"
+        # Joined once here; they are also the get_validator cache keys
+        self.schema_paths = {name: str(schema_dir / filename) for name, filename in SCHEMA_FILES.items()}
+
+    def get(self, name: str) -> Draft7Validator:
+        """Return the validator for a schema name, compiling it if needed."""
+        return get_validator(self.schema_paths[name])
+
+
+class InterningLoader(YAML_LOADER):
+    """
+    YAML_LOADER that interns mapping keys.
+
+    Every profile, agent and version document repeats the same few keys, so
+    interning lets all of them share one string object per key and makes
+    lookups like .get('developer') hit the identity shortcut.
+    """
 
-def count_nodes(obj, count=0) -> int:
+    def construct_mapping(self, node, deep=False):
+        if isinstance(node, yaml.MappingNode):
+            # Scalar constructors return node.value itself, so interning it here
+            # interns the key without rebuilding the mapping afterwards
+            for key_node, _ in node.value:
+                if isinstance(key_node, yaml.ScalarNode):
+                    key_node.value = sys.intern(key_node.value)
+        return super().construct_mapping(node, deep=deep)
+
+
+def count_nodes(buf: bytes) -> int:
     """
-    Recursively count nodes in a data structure.
+    Count nodes in a YAML document from its parser events, without building it.
+
+    Matches counting the loaded data structure (dict keys, list items,
+    scalars). Aliases count as the full size of the node they refer to,
+    so exponential expansion is caught without expanding anything.
+    Self-referencing aliases are rejected outright.
+
+    Raises:
+        ValueError: As soon as the count exceeds MAX_YAML_COMPLEXITY
 
     Returns:
-        Total number of nodes (dict keys, list items, scalars)
+        Total number of nodes
     """
-    if isinstance(obj, dict):
-        return sum(count_nodes(v) for v in obj.values()) + len(obj)
-    elif isinstance(obj, list):
-        return sum(count_nodes(item) for item in obj) + len(obj)
-    else:
-        return 1
+    count = 0
+    anchor_counts = {}
+    # One [node count, anchor, expecting_key] entry per open collection;
+    # expecting_key is None for sequences
+    stack = []
+
+    for event in yaml.parse(buf, Loader=YAML_LOADER):
+        if isinstance(event, yaml.MappingStartEvent):
+            stack.append([0, event.anchor, True])
+            continue
+        if isinstance(event, yaml.SequenceStartEvent):
+            stack.append([0, event.anchor, None])
+            continue
 
+        if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            nodes, anchor, _ = stack.pop()
+        elif isinstance(event, yaml.ScalarEvent):
+            nodes, anchor = 1, event.anchor
+        elif isinstance(event, yaml.AliasEvent):
+            # An alias to a collection that is still open would load as a cycle
+            if any(entry[1] == event.anchor for entry in stack):
+                raise ValueError(
+                    f"YAML too complex: alias *{event.anchor} refers to a node that contains it"
+                )
+            nodes, anchor = anchor_counts.get(event.anchor, 1), None
+        else:
+            continue
+
+        if anchor is not None:
+            anchor_counts[anchor] = nodes
+
+        if not stack:
+            count = nodes
+        else:
+            parent = stack[-1]
+            if parent[2] is True:
+                # Mapping keys are not counted, only their values
+                parent[2] = False
+                continue
+            if parent[2] is False:
+                parent[2] = True
+            parent[0] += 1 + nodes
+            count = parent[0]
+
+        if count > MAX_YAML_COMPLEXITY:
+            raise ValueError(
+                f"YAML too complex: more than {MAX_YAML_COMPLEXITY} nodes "
+                f"(max {MAX_YAML_COMPLEXITY})"
+            )
+
+    return count
 
-def load_yaml(yaml_path: Path) -> dict:
+
+def load_yaml(yaml_path: Union[str, Path], known_size: Optional[int] = None,
+              buf: Optional[bytes] = None) -> dict:
     """
     Load a YAML file with size and complexity validation.
 
+    Args:
+        yaml_path: File to load
+        known_size: File size if the caller already has it (skips the stat)
+        buf: File contents if the caller already read them (see bulk_read)
+
     Raises:
         ValueError: If file exceeds size or complexity limits
     """
     # Check file size before loading
-    file_size = yaml_path.stat().st_size
+    file_size = os.stat(yaml_path).st_size if known_size is None else known_size
     if file_size > MAX_YAML_SIZE:
         raise ValueError(
             f"YAML file too large: {file_size} bytes (max {MAX_YAML_SIZE})"
         )
 
-    with open(yaml_path, 'r') as f:
-        data = yaml.safe_load(f)
-
-    # Check complexity after parsing to detect exponential expansion
-    node_count = count_nodes(data)
-    if node_count > MAX_YAML_COMPLEXITY:
+    # Read the whole file at once and parse from memory; the cap also catches
+    # a file that grew after it was stat'ed
+    raw = read_file_bytes(yaml_path, MAX_YAML_SIZE + 1) if buf is None else buf
+    if len(raw) > MAX_YAML_SIZE:
         raise ValueError(
-            f"YAML too complex: {node_count} nodes (max {MAX_YAML_COMPLEXITY})"
+            f"YAML file too large: more than {MAX_YAML_SIZE} bytes (max {MAX_YAML_SIZE})"
         )
 
-    return data
+    # Check complexity before constructing anything to detect exponential expansion;
+    # only alias-free files too small to reach the limit are exempt
+    if len(raw) > MAX_UNCOUNTED_YAML_SIZE or b'*' in raw:
+        count_nodes(raw)
+    return yaml.load(raw, Loader=InterningLoader)
+
+
+def walk_folder(folder: Path) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Recursively yield ('link', entry) and ('file', entry) pairs under a folder.
+
+    Uses os.scandir so each DirEntry caches its type and stat results.
+    Symbolic links are yielded but never followed. Entries come in the same
+    order as Path.rglob('*'): a directory's entries, then its subdirectories.
+    """
+    subdirs = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_symlink():
+                yield 'link', entry
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield 'file', entry
+
+    for subdir in subdirs:
+        yield from walk_folder(subdir)
 
 
-def validate_file_types_and_sizes(developer_folder: Path) -> List[str]:
+def list_subdirs(path: Path) -> Optional[List[Path]]:
     """
-    Validate file types and sizes in a developer folder.
+    List the subdirectories of path with one os.scandir pass.
+
+    DirEntry.is_dir() answers from the cached d_type for plain directories.
+    It still follows symlinks, as Path.is_dir() did, so a linked directory is
+    validated rather than skipped (the developer folder scan rejects the link).
 
     Returns:
-        List of error messages (empty if valid)
+        Subdirectory paths, or None if path is not a directory
+    """
+    try:
+        with os.scandir(path) as it:
+            return [Path(entry.path) for entry in it if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def scan_developer_folder(developer_folder: Path) -> Tuple[List[str], Dict[str, os.DirEntry], int]:
+    """
+    Validate file types and sizes in a developer folder in a single walk.
+
+    The .yaml entries found along the way are returned so callers don't have
+    to glob or stat the same directory again; their stat results are cached.
+
+    Returns:
+        Tuple of (error messages, .yaml files keyed by relative path, total size in bytes)
     """
     errors = []
+    yaml_files = {}
     total_size = 0
+    # Every entry path starts with this prefix, so slicing it off gives the relative path
+    base_len = len(str(developer_folder) + os.sep)
+
+    for kind, entry in walk_folder(developer_folder):
+        rel = entry.path[base_len:]
 
-    for file_path in developer_folder.rglob('*'):
         # Reject symbolic links (not permitted)
-        if file_path.is_symlink():
-            errors.append(
-                f"  - {file_path.relative_to(developer_folder)}: "
-                f"Symbolic links not allowed"
-            )
+        if kind == 'link':
+            errors.append(f"{rel}: Symbolic links not allowed")
             continue
 
-        if not file_path.is_file():
+        # Reject ALL hidden files (no exceptions - no .gitkeep, no .gitignore)
+        if entry.name.startswith('.'):
+            errors.append(f"{rel}: Hidden files not allowed")
             continue
 
-        # Reject ALL hidden files (no exceptions - no .gitkeep, no .gitignore)
-        if file_path.name.startswith('.'):
+        file_size = entry.stat().st_size
+        total_size += file_size
+
+        # Check total developer folder size as we go; nothing past the limit is worth scanning
+        if total_size > MAX_DEVELOPER_FOLDER_SIZE:
             errors.append(
-                f"  - {file_path.relative_to(developer_folder)}: "
-                f"Hidden files not allowed"
+                f"Total folder size exceeds limit "
+                f"({MAX_DEVELOPER_FOLDER_SIZE} bytes = {MAX_DEVELOPER_FOLDER_SIZE // (1024*1024)} MB); "
+                f"stopped scanning at {total_size} bytes"
             )
+            return errors, yaml_files, total_size
+
+        # Fast path for the common case; all other files are rejected below
+        if entry.name.endswith('.yaml'):
+            yaml_files[rel] = entry
             continue
 
         # Case-sensitive extension check (must be exactly .yaml, not .YAML or .YaML)
-        ext = file_path.suffix
-        file_size = file_path.stat().st_size
-        total_size += file_size
+        ext = os.path.splitext(entry.name)[1]
 
         # Check file extension
         if ext not in ALLOWED_FILE_EXTENSIONS:
             errors.append(
-                f"  - {file_path.relative_to(developer_folder)}: "
+                f"{rel}: "
                 f"Disallowed file type '{ext}' (only lowercase .yaml extension allowed)"
             )
-            continue
 
-    # Check total developer folder size
-    if total_size > MAX_DEVELOPER_FOLDER_SIZE:
-        errors.append(
-            f"  - Total folder size {total_size} bytes exceeds limit "
-            f"({MAX_DEVELOPER_FOLDER_SIZE} bytes = {MAX_DEVELOPER_FOLDER_SIZE // (1024*1024)} MB)"
-        )
+    return errors, yaml_files, total_size
 
-    return errors
+
+def try_load_yaml(yaml_path: Union[str, Path], known_size: Optional[int] = None,
+                  buf: Optional[bytes] = None) -> Tuple[Any, List[str]]:
+    """
+    Load a YAML file, reporting problems as error messages instead of raising.
+
+    Returns:
+        Tuple of (data, error messages); data is None if loading failed
+    """
+    try:
+        return load_yaml(yaml_path, known_size, buf), []
+    except yaml.YAMLError as e:
+        return None, [f"YAML parsing error: {e}"]
+    except Exception as e:
+        return None, [f"Unexpected error: {e}"]
 
 
-def validate_file(yaml_path: Path, schema: dict, validator: Draft7Validator) -> List[str]:
+def validate_data(data: Any, validator: Draft7Validator) -> List[str]:
     """
-    Validate a single YAML file against a schema.
+    Validate already-parsed YAML data against a schema.
+
+    Valid data is confirmed by the fastjsonschema function when one was
+    compiled, otherwise by jsonschema's short-circuiting is_valid(). Only
+    data that fails is walked again with iter_errors, which collects every
+    error rather than stopping at the first.
 
     Returns:
         List of error messages (empty if valid)
     """
+    fast_validator = get_fast_validator(validator)
+    if fast_validator is not None:
+        try:
+            fast_validator(data)
+            return []
+        except Exception:
+            pass  # Rejected (or tripped up): fall through to the full jsonschema report
+
     errors = []
 
     try:
-        data = load_yaml(yaml_path)
-
-        # Validate against schema
-        validation_errors = list(validator.iter_errors(data))
+        if fast_validator is None and validator.is_valid(data):
+            return errors
 
-        if validation_errors:
-            for error in validation_errors:
-                path = ".".join(str(p) for p in error.path) if error.path else "root"
-                errors.append(f"  - {path}: {error.message}")
-
-    except yaml.YAMLError as e:
-        errors.append(f"  - YAML parsing error: {e}")
+        for error in validator.iter_errors(data):
+            path = ".".join(str(p) for p in error.path) if error.path else "root"
+            errors.append(f"{path}: {error.message}")
     except Exception as e:
-        errors.append(f"  - Unexpected error: {e}")
+        errors.append(f"Unexpected error: {e}")
 
     return errors
 
 
-def validate_developers(base_path: Path, developer_folder: str = None) -> Tuple[int, int]:
+def relative_path(path: Path, base_path: Path) -> str:
+    """Return path relative to base_path as a string, by slicing instead of Path.relative_to."""
+    # base_path / "_" has exactly the prefix joined paths carry (none when base_path is ".")
+    return str(path)[len(str(base_path / "_")) - 1:]
+
+
+def format_failure(heading: str, errors: List[str]) -> str:
+    """Render a failed item and its error messages as one block of output."""
+    return f"\n❌ {heading}\n" + "".join(f"  - {error}\n" for error in errors)
+
+
+def iter_prefetched(reader: Callable[[Any], Any], items: List[Any]) -> Iterator[Any]:
+    """
+    Yield reader(item) for each item in order, running one item ahead.
+
+    While the caller validates an item, a background thread already does the
+    reading for the next one, so disk latency hides behind parsing and schema work.
+    """
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        future = prefetcher.submit(reader, items[0])
+        for next_item in items[1:]:
+            data = future.result()
+            future = prefetcher.submit(reader, next_item)
+            yield data
+        yield future.result()
+
+
+def run_in_pool(func, items: List[Any], base_path: Path, schemas: SchemaRegistry,
+                reader: Optional[Callable[[Any], Any]] = None) -> Dict[Any, Any]:
+    """
+    Apply func(item, base_path, schemas) to every item, using a process pool when it helps.
+
+    Items are processed in the order they were discovered and the results are
+    keyed by item, so callers sort only at print time to keep output deterministic.
+    Without a pool, an optional reader does each item's I/O one item ahead and
+    its result is passed to func as a fourth argument.
+    """
+    workers = min(len(items), os.cpu_count() or 1)
+    if workers <= 1:
+        if reader is None or len(items) < 2:
+            return {item: func(item, base_path, schemas) for item in items}
+        return {
+            item: func(item, base_path, schemas, data)
+            for item, data in zip(items, iter_prefetched(reader, items))
+        }
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        args = [base_path] * len(items), [schemas] * len(items)
+        return dict(zip(items, executor.map(func, items, *args)))
+
+
+def report_results(results: Dict[Any, Tuple[bool, str]]) -> Tuple[int, int]:
+    """
+    Write every result's output in sorted key order with a single write.
+
+    Returns:
+        Tuple of (valid_count, error_count)
+    """
+    outputs = []
+    valid_count = 0
+
+    for key in sorted(results):
+        is_valid, output = results[key]
+        outputs.append(output)
+        valid_count += is_valid
+
+    sys.stdout.write("".join(outputs))
+    return valid_count, len(results) - valid_count
+
+
+def validate_developer_profile(profile_file: Path, base_path: Path,
+                               schemas: SchemaRegistry) -> Tuple[bool, str]:
+    """
+    Validate a single developer's folder and profile.yaml.
+
+    Returns:
+        Tuple of (is_valid, output text)
+    """
+    developer_name = profile_file.parent.name
+    heading = relative_path(profile_file, base_path)
+
+    # Validate folder name format (GitHub username rules)
+    if not VALID_DEVELOPER_NAME.fullmatch(developer_name):
+        return False, format_failure(heading, [
+            f"Invalid folder name format: '{developer_name}'",
+            f"Must match GitHub username rules: ^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$",
+            f"Start/end with alphanumeric, middle can contain hyphens",
+        ])
+
+    # Check file types and sizes BEFORE reading files
+    file_type_errors, _, _ = scan_developer_folder(profile_file.parent)
+    if file_type_errors:
+        return False, format_failure(heading, file_type_errors)
+
+    # Parse once for both the folder check and schema validation
+    data, errors = try_load_yaml(profile_file)
+    if errors:
+        return False, format_failure(heading, errors)
+
+    # Validate that folder name matches developer field
+    fields = data if isinstance(data, dict) else {}
+    developer_field = fields.get('developer', '')
+
+    if developer_name != developer_field:
+        return False, format_failure(heading, [
+            f"Folder name is '{developer_name}' but profile.yaml has developer: '{developer_field}'",
+            f"These must match exactly (folder ownership is checked via fork owner)",
+        ])
+
+    errors = validate_data(data, schemas.get('developer'))
+
+    if errors:
+        return False, format_failure(heading, errors)
+
+    return True, f"✅ {heading}\n"
+
+
+def validate_developers(base_path: Path, schemas: SchemaRegistry,
+                        developer_folder: str = None) -> Tuple[int, int]:
     """
     Validate developer profile.yaml files.
 
     Args:
         base_path: Repository root path
+        schemas: Registry the schema validators are taken from
         developer_folder: Optional specific developer folder name to validate
 
     Returns:
@@ -197,10 +633,6 @@ def validate_developers(base_path: Path, developer_folder: str = None) -> Tuple[
     print("VALIDATING DEVELOPER PROFILES")
     print("="*70)
 
-    schema_path = base_path / "schema" / "developer.schema.json"
-    schema = load_schema(schema_path)
-    validator = Draft7Validator(schema)
-
     developers_path = base_path / "developers"
 
     if developer_folder:
@@ -217,226 +649,237 @@ def validate_developers(base_path: Path, developer_folder: str = None) -> Tuple[
         print("\nNo developer profiles found.")
         return 0, 0
 
-    valid_count = 0
-    error_count = 0
-
-    for profile_file in sorted(profile_files):
-        developer_name = profile_file.parent.name
-
-        # Validate folder name format (GitHub username rules)
-        if not VALID_DEVELOPER_NAME.match(developer_name):
-            print(f"\n❌ {profile_file.relative_to(base_path)}")
-            print(f"  - Invalid folder name format: '{developer_name}'")
-            print(f"  - Must match GitHub username rules: ^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$")
-            print(f"  - Start/end with alphanumeric, middle can contain hyphens")
-            error_count += 1
-            continue
+    return report_results(run_in_pool(validate_developer_profile, profile_files, base_path, schemas))
 
-        # Check file types and sizes BEFORE reading files
-        file_type_errors = validate_file_types_and_sizes(profile_file.parent)
-        if file_type_errors:
-            print(f"\n❌ {profile_file.relative_to(base_path)}")
-            for error in file_type_errors:
-                print(error)
-            error_count += 1
-            continue
 
-        # Validate that folder name matches developer field
-        data = load_yaml(profile_file)
-        developer_field = data.get('developer', '')
+def check_identity_fields(identity_fields: Dict[str, Any], developer_name: str,
+                          agent_name: str) -> List[str]:
+    """
+    Cross-check agent.yaml's developer and name fields against its location.
 
-        if developer_name != developer_field:
-            print(f"\n❌ {profile_file.relative_to(base_path)}")
-            print(f"  - Folder name is '{developer_name}' but profile.yaml has developer: '{developer_field}'")
-            print(f"  - These must match exactly (folder ownership is checked via fork owner)")
-            error_count += 1
-            continue
+    Returns:
+        List of error messages (empty if consistent)
+    """
+    errors = []
 
-        errors = validate_file(profile_file, schema, validator)
+    # Check developer field matches folder
+    if identity_fields.get('developer') != developer_name:
+        errors.append(
+            f"agent.yaml: developer field '{identity_fields.get('developer')}' "
+            f"doesn't match folder '{developer_name}'"
+        )
 
-        if errors:
-            print(f"\n❌ {profile_file.relative_to(base_path)}")
-            for error in errors:
-                print(error)
-            error_count += 1
-        else:
-            print(f"✅ {profile_file.relative_to(base_path)}")
-            valid_count += 1
+    # Check name field matches directory
+    if identity_fields.get('name') != agent_name:
+        errors.append(
+            f"agent.yaml: name field '{identity_fields.get('name')}' "
+            f"doesn't match directory '{agent_name}'"
+        )
 
-    return valid_count, error_count
+    return errors
 
 
-def validate_agents(base_path: Path, developer_folder: str = None) -> Tuple[int, int]:
+def read_agent_dir(agent_dir: Path) -> Tuple[List[str], Dict[str, os.DirEntry], Dict[str, bytes]]:
     """
-    Validate agent directories with identity + version files.
+    Do the I/O half of validating an agent directory: scan it, then read its files.
 
-    Args:
-        base_path: Repository root path
-        developer_folder: Optional specific developer folder name to validate
+    Files are only read once the scan found no problems and agent.yaml exists.
 
     Returns:
-        Tuple of (valid_count, error_count)
+        Tuple of (file type errors, .yaml entries by relative path, file contents by path)
     """
-    print("\n" + "="*70)
-    print("VALIDATING AGENT DEFINITIONS")
-    print("="*70)
-
-    # Load schemas
-    identity_schema_path = base_path / "schema" / "agent-identity.schema.json"
-    versions_schema_path = base_path / "schema" / "versions.schema.json"
-    version_schema_path = base_path / "schema" / "agent-version.schema.json"
-    identity_schema = load_schema(identity_schema_path)
-    versions_schema = load_schema(versions_schema_path)
-    version_schema = load_schema(version_schema_path)
-    identity_validator = Draft7Validator(identity_schema)
-    versions_validator = Draft7Validator(versions_schema)
-    version_validator = Draft7Validator(version_schema)
+    # Check file types and sizes BEFORE reading files
+    file_type_errors, yaml_files, _ = scan_developer_folder(agent_dir)
+    if file_type_errors or "agent.yaml" not in yaml_files:
+        return file_type_errors, yaml_files, {}
 
-    developers_path = base_path / "developers"
+    # Read the agent's top-level files together to overlap disk latency
+    contents = bulk_read([entry.path for rel, entry in yaml_files.items()
+                          if os.sep not in rel and entry.stat().st_size <= MAX_YAML_SIZE])
+    return file_type_errors, yaml_files, contents
 
-    # Find agent directories
-    if developer_folder:
-        agents_path = developers_path / developer_folder / "agents"
-        if not agents_path.exists():
-            print(f"\nNo agents folder found for {developer_folder}.")
-            return 0, 0
-        agent_dirs = [d for d in agents_path.iterdir() if d.is_dir()]
-    else:
-        agent_dirs = []
-        for dev_dir in developers_path.iterdir():
-            if not dev_dir.is_dir():
-                continue
-            agents_path = dev_dir / "agents"
-            if agents_path.exists():
-                agent_dirs.extend([d for d in agents_path.iterdir() if d.is_dir()])
 
-    if not agent_dirs:
-        print("\nNo agent directories found.")
-        return 0, 0
+def validate_agent_dir(agent_dir: Path, base_path: Path, schemas: SchemaRegistry,
+                       files: Optional[Tuple[List[str], Dict[str, os.DirEntry], Dict[str, bytes]]] = None
+                       ) -> Tuple[bool, str]:
+    """
+    Validate a single agent directory (identity, versions.yaml and version files).
 
-    valid_count = 0
-    error_count = 0
-
-    for agent_dir in sorted(agent_dirs):
-        developer_name = agent_dir.parent.parent.name
-        agent_name = agent_dir.name
-        has_errors = False
-        all_errors = []
-
-        # Check file types and sizes BEFORE reading files
-        file_type_errors = validate_file_types_and_sizes(agent_dir)
-        if file_type_errors:
-            print(f"\n❌ {agent_dir.relative_to(base_path)}/")
-            for error in file_type_errors:
-                print(error)
-            error_count += 1
-            continue
+    Args:
+        files: Result of read_agent_dir(agent_dir) if it was already done
 
-        # Validate agent.yaml (identity)
-        agent_yaml = agent_dir / "agent.yaml"
-        if not agent_yaml.exists():
-            print(f"\n❌ {agent_dir.relative_to(base_path)}")
-            print(f"  - Missing agent.yaml file")
-            error_count += 1
+    Returns:
+        Tuple of (is_valid, output text)
+    """
+    developer_name = agent_dir.parent.parent.name
+    agent_name = agent_dir.name
+    heading = relative_path(agent_dir, base_path)
+    has_errors = False
+    all_errors = []
+
+    file_type_errors, yaml_files, contents = read_agent_dir(agent_dir) if files is None else files
+    if file_type_errors:
+        return False, format_failure(f"{heading}/", file_type_errors)
+
+    # Validate agent.yaml (identity)
+    agent_yaml = yaml_files.get("agent.yaml")
+    if agent_yaml is None:
+        return False, format_failure(heading, ["Missing agent.yaml file"])
+
+    # Find version files; agent.yaml and versions.yaml aside, every top-level
+    # .yaml must be named like 0.1.0.yaml
+    version_files = []
+    misnamed_files = []
+    for rel in sorted(yaml_files):
+        if os.sep in rel or rel in ('agent.yaml', 'versions.yaml'):
             continue
-
-        identity_data = load_yaml(agent_yaml)
-
-        # Check developer field matches folder
-        if identity_data.get('developer') != developer_name:
-            all_errors.append(
-                f"  - agent.yaml: developer field '{identity_data.get('developer')}' "
-                f"doesn't match folder '{developer_name}'"
-            )
-            has_errors = True
-
-        # Check name field matches directory
-        if identity_data.get('name') != agent_name:
-            all_errors.append(
-                f"  - agent.yaml: name field '{identity_data.get('name')}' "
-                f"doesn't match directory '{agent_name}'"
-            )
+        if VERSION_FILE_NAME.fullmatch(rel):
+            version_files.append(yaml_files[rel])
+        else:
+            misnamed_files.append(rel)
+    available_versions = frozenset(entry.name[:-len('.yaml')] for entry in version_files)
+
+    # Parse once for both the cross-checks and schema validation
+    identity_data, identity_errors = try_load_yaml(
+        agent_yaml.path, agent_yaml.stat().st_size, contents.get(agent_yaml.path)
+    )
+    if not identity_errors:
+        identity_fields = identity_data if isinstance(identity_data, dict) else {}
+        consistency_errors = check_identity_fields(identity_fields, developer_name, agent_name)
+        if consistency_errors:
+            all_errors.extend(consistency_errors)
             has_errors = True
 
         # Validate identity against schema
-        identity_errors = validate_file(agent_yaml, identity_schema, identity_validator)
-        if identity_errors:
-            all_errors.extend([f"  - agent.yaml{e.lstrip('  -')}" for e in identity_errors])
-            has_errors = True
+        identity_errors = validate_data(identity_data, schemas.get('agent_identity'))
+
+    if identity_errors:
+        all_errors.extend([f"agent.yaml: {e}" for e in identity_errors])
+        has_errors = True
 
-        # Validate versions.yaml
-        versions_yaml = agent_dir / "versions.yaml"
-        if not versions_yaml.exists():
-            all_errors.append(f"  - Missing versions.yaml file")
+    # Validate versions.yaml
+    versions_yaml = yaml_files.get("versions.yaml")
+    if versions_yaml is None:
+        all_errors.append("Missing versions.yaml file")
+        has_errors = True
+    else:
+        versions_management, versions_errors = try_load_yaml(
+            versions_yaml.path, versions_yaml.stat().st_size, contents.get(versions_yaml.path)
+        )
+
+        # Validate versions.yaml against schema
+        if not versions_errors:
+            versions_errors = validate_data(versions_management, schemas.get('versions'))
+        if versions_errors:
+            all_errors.extend([f"versions.yaml: {e}" for e in versions_errors])
             has_errors = True
-        else:
-            versions_management = load_yaml(versions_yaml)
 
-            # Validate versions.yaml against schema
-            versions_errors = validate_file(versions_yaml, versions_schema, versions_validator)
-            if versions_errors:
-                all_errors.extend([f"  - versions.yaml{e.lstrip('  -')}" for e in versions_errors])
+        if not isinstance(versions_management, dict):
+            versions_management = {}
+
+        # Check that 'latest_version' field points to existing version file
+        latest_version = versions_management.get('latest_version')
+        if latest_version:
+            if str(latest_version) not in available_versions:
+                all_errors.append(
+                    f"versions.yaml: latest_version '{latest_version}' "
+                    f"does not match any version file ({latest_version}.yaml not found)"
+                )
                 has_errors = True
 
-            # Check that 'latest_version' field points to existing version file
-            latest_version = versions_management.get('latest_version')
-            if latest_version:
-                latest_version_file = agent_dir / f"{latest_version}.yaml"
-                if not latest_version_file.exists():
-                    all_errors.append(
-                        f"  - versions.yaml: latest_version '{latest_version}' "
-                        f"does not match any version file ({latest_version}.yaml not found)"
-                    )
-                    has_errors = True
-
-            # Check that all listed_versions point to existing files
-            listed_versions = versions_management.get('listed_versions', [])
+        # Check that all listed_versions point to existing files; one set
+        # difference covers the common case where nothing is missing
+        listed_versions = versions_management.get('listed_versions', [])
+        if not isinstance(listed_versions, list):
+            listed_versions = []  # Wrong type is already reported by the schema
+        missing_versions = set(map(str, listed_versions)) - available_versions
+        if missing_versions:
             for listed_version in listed_versions:
-                listed_version_file = agent_dir / f"{listed_version}.yaml"
-                if not listed_version_file.exists():
+                if str(listed_version) in missing_versions:
                     all_errors.append(
-                        f"  - versions.yaml: listed_versions contains '{listed_version}' "
+                        f"versions.yaml: listed_versions contains '{listed_version}' "
                         f"but {listed_version}.yaml not found"
                     )
-                    has_errors = True
-
-        # Find and validate version files
-        # Exclude agent.yaml and versions.yaml, match version files like 0.1.0.yaml
-        version_files = sorted([f for f in agent_dir.glob("*.yaml")
-                               if f.name not in ['agent.yaml', 'versions.yaml']])
-        if not version_files:
-            all_errors.append(f"  - No version files found (e.g., 0.1.0.yaml)")
             has_errors = True
-        else:
-            for version_file in version_files:
-                version_data = load_yaml(version_file)
+
+    # Validate version files
+    for rel in misnamed_files:
+        all_errors.append(f"{rel}: Not a version file name (expected e.g. 0.1.0.yaml)")
+        has_errors = True
+    if not version_files:
+        all_errors.append("No version files found (e.g., 0.1.0.yaml)")
+        has_errors = True
+    else:
+        version_validator = schemas.get('agent_version')
+        for version_file in version_files:
+            # Parse once for both the filename check and schema validation
+            version_data, version_errors = try_load_yaml(
+                version_file.path, version_file.stat().st_size, contents.get(version_file.path)
+            )
+            if not version_errors:
+                version_fields = version_data if isinstance(version_data, dict) else {}
 
                 # Check version matches filename
-                file_version = version_file.stem
-                data_version = version_data.get('version', '')
+                file_version = version_file.name[:-len('.yaml')]
+                data_version = version_fields.get('version', '')
                 if data_version != file_version:
                     all_errors.append(
-                        f"  - {version_file.name}: version field '{data_version}' "
+                        f"{version_file.name}: version field '{data_version}' "
                         f"doesn't match filename (expected '{file_version}')"
                     )
                     has_errors = True
 
                 # Validate version against schema
-                version_errors = validate_file(version_file, version_schema, version_validator)
-                if version_errors:
-                    all_errors.extend([f"  - {version_file.name}{e.lstrip('  -')}" for e in version_errors])
-                    has_errors = True
+                version_errors = validate_data(version_data, version_validator)
 
-        if has_errors:
-            print(f"\n❌ {agent_dir.relative_to(base_path)}/")
-            for error in all_errors:
-                print(error)
-            error_count += 1
-        else:
-            print(f"✅ {agent_dir.relative_to(base_path)}/ ({len(version_files)} versions)")
-            valid_count += 1
+            if version_errors:
+                all_errors.extend([f"{version_file.name}: {e}" for e in version_errors])
+                has_errors = True
+
+    if has_errors:
+        return False, format_failure(f"{heading}/", all_errors)
+
+    return True, f"✅ {heading}/ ({len(version_files)} versions)\n"
+
+
+def validate_agents(base_path: Path, schemas: SchemaRegistry,
+                    developer_folder: str = None) -> Tuple[int, int]:
+    """
+    Validate agent directories with identity + version files.
+
+    Args:
+        base_path: Repository root path
+        schemas: Registry the schema validators are taken from
+        developer_folder: Optional specific developer folder name to validate
+
+    Returns:
+        Tuple of (valid_count, error_count)
+    """
+    print("\n" + "="*70)
+    print("VALIDATING AGENT DEFINITIONS")
+    print("="*70)
+
+    developers_path = base_path / "developers"
+
+    # Find agent directories
+    if developer_folder:
+        agent_dirs = list_subdirs(developers_path / developer_folder / "agents")
+        if agent_dirs is None:
+            print(f"\nNo agents folder found for {developer_folder}.")
+            return 0, 0
+    else:
+        agent_dirs = []
+        for dev_dir in list_subdirs(developers_path) or []:
+            agent_dirs.extend(list_subdirs(dev_dir / "agents") or [])
+
+    if not agent_dirs:
+        print("\nNo agent directories found.")
+        return 0, 0
 
-    return valid_count, error_count
+    # Agent directories are independent, so they are validated in parallel
+    return report_results(
+        run_in_pool(validate_agent_dir, agent_dirs, base_path, schemas, reader=read_agent_dir)
+    )
 
 
 def main():
@@ -447,6 +890,7 @@ def main():
 
     arg = sys.argv[1]
     base_path = Path(__file__).parent.parent
+    schemas = SchemaRegistry(base_path)
 
     # Check if argument is a specific developer folder path
     if arg.startswith("developers/"):
@@ -456,11 +900,11 @@ def main():
         total_valid = 0
         total_errors = 0
 
-        valid, errors = validate_developers(base_path, developer_folder)
+        valid, errors = validate_developers(base_path, schemas, developer_folder)
         total_valid += valid
         total_errors += errors
 
-        valid, errors = validate_agents(base_path, developer_folder)
+        valid, errors = validate_agents(base_path, schemas, developer_folder)
         total_valid += valid
         total_errors += errors
 
@@ -471,12 +915,12 @@ def main():
         total_errors = 0
 
         if mode in ["developers", "all"]:
-            valid, errors = validate_developers(base_path)
+            valid, errors = validate_developers(base_path, schemas)
             total_valid += valid
             total_errors += errors
 
         if mode in ["agents", "all"]:
-            valid, errors = validate_agents(base_path)
+            valid, errors = validate_agents(base_path, schemas)
             total_valid += valid
             total_errors += errors
 